@@ -12,6 +12,73 @@ from enum import Enum
 from neo4j import GraphDatabase
 from app import RelationExtractor, EmotionalAnalyzer
 
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:  # type non géré par orjson : repli sur la lib standard
+            return json.dumps(obj).encode()
+
+    _loads = orjson.loads
+except ImportError:  # orjson optionnel : repli sur la lib standard
+    _dumps, _loads = json.dumps, json.loads
+
+# Décodeurs de corps de message par content_encoding (bibliothèques optionnelles)
+_BODY_DECODERS = {}
+try:
+    import zstandard
+    _BODY_DECODERS['zstd'] = zstandard.ZstdDecompressor().decompress
+except ImportError:
+    pass
+
+
+def decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Décompresse un corps de message selon son content_encoding AMQP"""
+    if not content_encoding:
+        return body
+    decoder = _BODY_DECODERS.get(content_encoding)
+    if decoder is None:
+        raise ValueError(f"content_encoding non supporté: {content_encoding}")
+    return decoder(body)
+
+
+# Format binaire optionnel, choisi par le client via le content_type AMQP
+MSGPACK_CONTENT_TYPE = 'application/x-msgpack'
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _msgpack_default(obj):
+    """Types hors msgpack (numpy, dates Neo4j...) convertis en natifs"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    return str(obj)
+
+
+def _msgpack_dumps(obj) -> bytes:
+    return msgpack.packb(obj, use_bin_type=True, default=_msgpack_default)
+
+
+def _msgpack_loads(body: bytes):
+    return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+def body_format(content_type: Optional[str]):
+    """(loads, dumps, content_type de réponse) selon le content_type de la requête
+
+    Tout autre type que msgpack est traité comme du JSON (clients existants).
+    """
+    if content_type != MSGPACK_CONTENT_TYPE:
+        return _loads, _dumps, 'application/json'
+    if msgpack is None:
+        raise ValueError(f"content_type non supporté: {content_type} (paquet msgpack absent)")
+    return _msgpack_loads, _msgpack_dumps, content_type
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -46,6 +113,7 @@ class RequestType(Enum):
     """Types de requêtes supportées"""
     # Mémoire de base
     CREATE_MEMORY = "create_memory"
+    BATCH_CREATE_MEMORY = "batch_create_memory"  # N souvenirs, un seul UNWIND
     MERGE_MEMORY = "merge_memory"
     CREATE_TRAUMA = "create_trauma"
     GET_MEMORY = "get_memory"
@@ -174,6 +242,7 @@ class Neo4jService:
         self.handlers = {
             # Mémoire de base
             RequestType.CREATE_MEMORY.value: self._handle_create_memory,
+            RequestType.BATCH_CREATE_MEMORY.value: self._handle_batch_create_memory,
             RequestType.MERGE_MEMORY.value: self._handle_merge_memory,
             RequestType.CREATE_TRAUMA.value: self._handle_create_trauma,
             RequestType.GET_MEMORY.value: self._handle_get_memory,
@@ -256,22 +325,34 @@ class Neo4jService:
 
         def callback(ch, method, properties, body):
             try:
-                request_data = json.loads(body.decode())
-                request = Neo4jRequest(**request_data)
-
-                start_time = datetime.now()
-                response = self._process_request(request)
-                response.execution_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+                loads, dumps, content_type = _loads, _dumps, 'application/json'
+                try:
+                    loads, dumps, content_type = body_format(properties.content_type)
+                    body = decode_body(body, properties.content_encoding)
+                except ValueError as e:
+                    # Format ou encodage inconnu : le client attend une réponse, pas un timeout
+                    logger.error(f"Requête rejetée: {e}")
+                    request_id = properties.correlation_id
+                    response = Neo4jResponse(request_id=request_id, success=False, error=str(e))
+                else:
+                    request = Neo4jRequest(**loads(body))
+                    request_id = request.request_id
+
+                    start_time = datetime.now()
+                    response = self._process_request(request)
+                    response.execution_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
                 # Envoyer la réponse
-                routing_key = properties.reply_to or f"response.{request.request_id}"
+                routing_key = properties.reply_to or f"response.{request_id}"
                 ch.basic_publish(
-                    exchange=self.response_exchange,
+                    # Direct Reply-To : la pseudo-queue n'est joignable que
+                    # par l'exchange par défaut
+                    exchange='' if routing_key.startswith('amq.rabbitmq.reply-to') else self.response_exchange,
                     routing_key=routing_key,
-                    body=json.dumps(asdict(response)),
+                    body=dumps(asdict(response)),
                     properties=pika.BasicProperties(
                         correlation_id=properties.correlation_id,
-                        content_type='application/json'
+                        content_type=content_type
                     )
                 )
 
@@ -481,6 +562,63 @@ class Neo4jService:
             'emotional_states': deserialize_emotional_states(emotional_states_json)
         }
 
+    def _handle_batch_create_memory(self, payload: Dict) -> Dict:
+        """Crée plusieurs souvenirs avec un seul UNWIND (une transaction, un plan)
+
+        Les éléments avec un contexte passent par _handle_create_memory, chacun
+        dans sa propre transaction, avant l'UNWIND : l'extraction de concepts
+        et de relations se fait souvenir par souvenir.
+        Les ids retournés suivent l'ordre des éléments reçus.
+        """
+        rows = []
+        created_ids = []
+        batch_ts = datetime.now().timestamp()
+        for index, item in enumerate(payload.get('items', [])):
+            if item.get('context'):
+                created_ids.append(self._handle_create_memory(item)['id'])
+                continue
+
+            sentence_id = item.get('sentence_id')
+            emotional_states = item.get('emotional_states', {})
+            if sentence_id and not emotional_states:
+                emotional_states = {str(sentence_id): item.get('emotions', [0.0] * 24)}
+
+            # Id par défaut suffixé par l'index : unique au sein du lot
+            memory_id = item.get('id', f"MEM_{batch_ts}_{index}")
+            created_ids.append(memory_id)
+            rows.append({
+                'id': memory_id,
+                'type': item.get('type', 'Episodic'),
+                'emotional_states': serialize_emotional_states(emotional_states),
+                'dominant': item.get('dominant', 'Neutre'),
+                'intensity': item.get('intensity', 0.0),
+                'valence': item.get('valence', 0.5),
+                'weight': item.get('weight', 0.5),
+                'keywords': item.get('keywords', []),
+            })
+
+        if rows:
+            with self.driver.session() as session:
+                session.run("""
+                    UNWIND $rows AS row
+                    CREATE (m:Memory {
+                        id: row.id,
+                        type: row.type,
+                        emotional_states: row.emotional_states,
+                        dominant: row.dominant,
+                        intensity: row.intensity,
+                        valence: row.valence,
+                        weight: row.weight,
+                        context: '',
+                        keywords: row.keywords,
+                        created_at: datetime(),
+                        last_activated: datetime(),
+                        activation_count: 1
+                    })
+                """, rows=rows).consume()
+
+        return {'ids': created_ids, 'count': len(created_ids)}
+
     def _handle_merge_memory(self, payload: Dict) -> Dict:
         """Fusionne avec un souvenir existant en ajoutant les emotional_states"""
         target_id = payload['target_id']
@@ -1222,16 +1360,24 @@ class Neo4jService:
         }
 
     def _handle_get_concepts_by_memory(self, payload: Dict) -> List[Dict]:
-        """Récupère tous les concepts associés à une mémoire avec emotional_states"""
+        """Récupère les concepts associés à une mémoire avec emotional_states
+
+        'limit' (optionnel) borne le nombre de concepts ; tous par défaut.
+        """
         memory_id = payload['memory_id']
+        limit = payload.get('limit')
 
-        with self.driver.session() as session:
-            result = session.run("""
+        query = """
                 MATCH (m:Memory {id: $mem_id})-[:EVOQUE]->(c:Concept)
                 RETURN c.name AS name, c.memory_ids AS memory_ids, 
                        c.emotional_states AS emotional_states,
                        c.trauma_associated AS trauma_associated
-            """, mem_id=memory_id)
+            """
+        if limit is not None:
+            query += "LIMIT $limit"
+
+        with self.driver.session() as session:
+            result = session.run(query, mem_id=memory_id, limit=limit)
 
             concepts = []
             for record in result:
@@ -10,147 +10,254 @@ import sys
 import time
 import uuid
 import pika
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from neo4j import GraphDatabase
 
-
-def test_neo4j_connection(uri: str, user: str, password: str) -> bool:
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:  # orjson is optional: fall back to the standard library
+    _dumps, _loads = json.dumps, json.loads
+
+_BANNER = "=" * 60
+
+# Constant AMQP properties (requests that expect no reply)
+_JSON_PROPS = pika.BasicProperties(content_type='application/json')
+
+# Constant 24-value emotion vectors used by the tests
+_EMO_CRUD = [0.5, 0.3, 0.2] + [0.0] * 21
+_EMO_RT = [0.8] + [0.0] * 23
+
+# Fully parameterized CRUD queries: the text never changes, so Neo4j reuses
+# the cached plan and the driver always receives the same str objects
+_CREATE_Q = """
+    CREATE (m:Memory:Test {
+        id: $id,
+        emotions: $emotions,
+        dominant: $dominant,
+        intensity: $intensity,
+        valence: $valence,
+        weight: $weight,
+        context: $context,
+        created_at: datetime()
+    })
+"""
+_READ_Q = """
+    MATCH (m:Memory {id: $id})
+    RETURN m.dominant AS dominant, m.intensity AS intensity
+"""
+_UPDATE_Q = """
+    MATCH (m:Memory {id: $id})
+    SET m.weight = $weight, m.activation_count = $activation_count
+"""
+_WEIGHT_Q = """
+    MATCH (m:Memory {id: $id})
+    RETURN m.weight AS weight
+"""
+_DELETE_Q = "MATCH (m:Memory {id: $id}) DETACH DELETE m"
+_COUNT_Q = "MATCH (m:Memory {id: $id}) RETURN count(m) AS count"
+
+_CRUD_MEMORY = {
+    'emotions': _EMO_CRUD,
+    'dominant': 'Joie',
+    'intensity': 0.7,
+    'valence': 0.8,
+    'weight': 0.5,
+    'context': 'Test memory for integration testing',
+}
+_CRUD_UPDATED_WEIGHT = 0.9
+
+
+# (environment variable, local default, docker default)
+_CONFIG_DEFAULTS = (
+    ('NEO4J_URI', 'bolt://localhost:7687', 'bolt://neo4j:7687'),
+    ('NEO4J_USER', 'neo4j', 'neo4j'),
+    ('NEO4J_PASSWORD', '', ''),
+    ('RABBITMQ_HOST', 'localhost', 'rabbitmq'),
+    ('RABBITMQ_USER', 'virtus', 'virtus'),
+    ('RABBITMQ_PASS', 'virtus@83', 'virtus@83'),
+)
+
+
+@dataclass
+class IntegrationConfig:
+    """Integration test configuration"""
+    neo4j_uri: str
+    neo4j_user: str
+    neo4j_password: str
+    rabbitmq_host: str
+    rabbitmq_user: str
+    rabbitmq_pass: str
+
+    @classmethod
+    def from_env(cls, docker_mode: bool) -> 'IntegrationConfig':
+        """Read the configuration from the environment (defaults depend on the mode)"""
+        return cls(*(os.getenv(key, docker if docker_mode else local)
+                     for key, local, docker in _CONFIG_DEFAULTS))
+
+
+def _make_driver(uri: str, user: str, password: str, **extra):
+    """Create the Neo4j driver (authenticated only when a password is set)"""
+    kwargs = {'auth': (user, password)} if password else {}
+    kwargs.update(extra)
+    return GraphDatabase.driver(uri, **kwargs)
+
+
+class _Log:
+    """Collect a test's output lines and write them in a single call"""
+
+    def __init__(self):
+        self._lines = []
+
+    def append(self, line: str):
+        self._lines.append(line)
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+
+
+def test_neo4j_connection(session, uri: str) -> bool:
     """Test direct Neo4j connection"""
-    print(f"\n{'='*60}")
-    print("TEST 1: Connexion directe à Neo4j")
-    print(f"{'='*60}")
+    log = _Log()
+    log.append("\n" + _BANNER)
+    log.append("TEST 1: Connexion directe à Neo4j")
+    log.append(_BANNER)
 
     try:
-        if password:
-            driver = GraphDatabase.driver(uri, auth=(user, password))
-        else:
-            driver = GraphDatabase.driver(uri)
+        result = session.run("RETURN 1 AS test")
+        value = result.single()['test']
+        if value != 1:
+            raise AssertionError("Unexpected result")
 
-        with driver.session() as session:
-            result = session.run("RETURN 1 AS test")
-            value = result.single()['test']
-            assert value == 1, "Unexpected result"
-
-        driver.close()
-        print(f"✓ Connexion Neo4j OK ({uri})")
+        log.append(f"✓ Connexion Neo4j OK ({uri})")
+        log.flush()
         return True
 
     except Exception as e:
+        log.flush()
         print(f"✗ Erreur Neo4j: {e}")
         return False
 
 
-def test_rabbitmq_connection(host: str, user: str, password: str) -> bool:
-    """Test RabbitMQ connection"""
-    print(f"\n{'='*60}")
-    print("TEST 2: Connexion à RabbitMQ")
-    print(f"{'='*60}")
-
-    try:
-        credentials = pika.PlainCredentials(user, password)
-        connection = pika.BlockingConnection(
-            pika.ConnectionParameters(host=host, credentials=credentials)
+@contextmanager
+def rabbit_channel(host: str, user: str, password: str):
+    """Open a RabbitMQ connection and yield a channel shared by the tests"""
+    connection = pika.BlockingConnection(
+        pika.ConnectionParameters(
+            host=host,
+            credentials=pika.PlainCredentials(user, password),
+            heartbeat=30,
+            blocked_connection_timeout=15
         )
+    )
+    try:
         channel = connection.channel()
+        # Publisher confirms: basic_publish returns once the broker has the message,
+        # so the roundtrip cleanup request cannot be lost when the connection closes
+        channel.confirm_delivery()
+        yield channel
+    finally:
+        connection.close()
+
 
+def test_rabbitmq_connection(channel, host: str) -> bool:
+    """Test RabbitMQ connection"""
+    log = _Log()
+    log.append("\n" + _BANNER)
+    log.append("TEST 2: Connexion à RabbitMQ")
+    log.append(_BANNER)
+
+    try:
         # Declare test queue
         channel.queue_declare(queue='test.queue', durable=False, auto_delete=True)
 
-        connection.close()
-        print(f"✓ Connexion RabbitMQ OK ({host})")
+        log.append(f"✓ Connexion RabbitMQ OK ({host})")
+        log.flush()
         return True
 
     except Exception as e:
+        log.flush()
         print(f"✗ Erreur RabbitMQ: {e}")
         return False
 
 
-def test_neo4j_crud(uri: str, user: str, password: str) -> bool:
+def _crud_transaction(tx, memory_id: str):
+    """Run CREATE / READ / UPDATE / DELETE in a single transaction"""
+    # Parameter dicts are built once and passed positionally (no **kwargs unpacking)
+    key = {'id': memory_id}
+    create_params = dict(_CRUD_MEMORY, id=memory_id)
+    update_params = {'id': memory_id, 'weight': _CRUD_UPDATED_WEIGHT, 'activation_count': 1}
+
+    # CREATE
+    tx.run(_CREATE_Q, create_params)
+
+    # READ
+    read = tx.run(_READ_Q, key).single()
+
+    # UPDATE
+    tx.run(_UPDATE_Q, update_params)
+    weight = tx.run(_WEIGHT_Q, key).single()['weight']
+
+    # DELETE
+    tx.run(_DELETE_Q, key)
+    count = tx.run(_COUNT_Q, key).single()['count']
+
+    return read, weight, count
+
+
+def test_neo4j_crud(session) -> bool:
     """Test Neo4j CRUD operations"""
-    print(f"\n{'='*60}")
-    print("TEST 3: Opérations CRUD Neo4j")
-    print(f"{'='*60}")
+    log = _Log()
+    log.append("\n" + _BANNER)
+    log.append("TEST 3: Opérations CRUD Neo4j")
+    log.append(_BANNER)
 
     try:
-        if password:
-            driver = GraphDatabase.driver(uri, auth=(user, password))
-        else:
-            driver = GraphDatabase.driver(uri)
-
         test_id = f"TEST_{uuid.uuid4().hex[:8]}"
 
-        with driver.session() as session:
-            # CREATE
-            print("  → CREATE Memory node...")
-            session.run("""
-                CREATE (m:Memory:Test {
-                    id: $id,
-                    emotions: [0.5, 0.3, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0,
-                               0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
-                               0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                    dominant: 'Joie',
-                    intensity: 0.7,
-                    valence: 0.8,
-                    weight: 0.5,
-                    context: 'Test memory for integration testing',
-                    created_at: datetime()
-                })
-            """, id=test_id)
-            print(f"    ✓ Créé: {test_id}")
-
-            # READ
-            print("  → READ Memory node...")
-            result = session.run("""
-                MATCH (m:Memory {id: $id})
-                RETURN m.dominant AS dominant, m.intensity AS intensity
-            """, id=test_id)
-            record = result.single()
-            assert record['dominant'] == 'Joie', "Wrong dominant emotion"
-            assert record['intensity'] == 0.7, "Wrong intensity"
-            print(f"    ✓ Lu: dominant={record['dominant']}, intensity={record['intensity']}")
-
-            # UPDATE
-            print("  → UPDATE Memory node...")
-            session.run("""
-                MATCH (m:Memory {id: $id})
-                SET m.weight = 0.9, m.activation_count = 1
-            """, id=test_id)
-            result = session.run("""
-                MATCH (m:Memory {id: $id})
-                RETURN m.weight AS weight
-            """, id=test_id)
-            weight = result.single()['weight']
-            assert weight == 0.9, "Update failed"
-            print(f"    ✓ Mis à jour: weight={weight}")
-
-            # DELETE
-            print("  → DELETE Memory node...")
-            session.run("MATCH (m:Memory {id: $id}) DETACH DELETE m", id=test_id)
-            result = session.run("MATCH (m:Memory {id: $id}) RETURN count(m) AS count", id=test_id)
-            count = result.single()['count']
-            assert count == 0, "Delete failed"
-            print(f"    ✓ Supprimé")
+        log.append("  → CREATE / READ / UPDATE / DELETE Memory node (1 transaction)...")
+        record, weight, count = session.execute_write(_crud_transaction, test_id)
 
-        driver.close()
-        print("✓ Opérations CRUD OK")
+        log.append(f"    ✓ Créé: {test_id}")
+
+        if record['dominant'] != _CRUD_MEMORY['dominant']:
+            raise AssertionError("Wrong dominant emotion")
+        if record['intensity'] != _CRUD_MEMORY['intensity']:
+            raise AssertionError("Wrong intensity")
+        log.append(f"    ✓ Lu: dominant={record['dominant']}, intensity={record['intensity']}")
+
+        if weight != _CRUD_UPDATED_WEIGHT:
+            raise AssertionError("Update failed")
+        log.append(f"    ✓ Mis à jour: weight={weight}")
+
+        if count != 0:
+            raise AssertionError("Delete failed")
+        log.append(f"    ✓ Supprimé")
+
+        log.append("✓ Opérations CRUD OK")
+        log.flush()
         return True
 
     except Exception as e:
+        log.flush()
         print(f"✗ Erreur CRUD: {e}")
         return False
 
 
-def test_service_roundtrip(rabbitmq_host: str, rabbitmq_user: str, rabbitmq_pass: str) -> bool:
+def test_service_roundtrip(channel) -> bool:
     """Test sending a request through RabbitMQ to Neo4j service"""
-    print(f"\n{'='*60}")
-    print("TEST 4: Communication via RabbitMQ (roundtrip)")
-    print(f"{'='*60}")
+    log = _Log()
+    log.append("\n" + _BANNER)
+    log.append("TEST 4: Communication via RabbitMQ (roundtrip)")
+    log.append(_BANNER)
 
     try:
-        credentials = pika.PlainCredentials(rabbitmq_user, rabbitmq_pass)
-        connection = pika.BlockingConnection(
-            pika.ConnectionParameters(host=rabbitmq_host, credentials=credentials)
-        )
-        channel = connection.channel()
+        connection = channel.connection
 
         # Setup
         request_queue = 'neo4j.requests.queue'
@@ -159,8 +266,13 @@ def test_service_roundtrip(rabbitmq_host: str, rabbitmq_user: str, rabbitmq_pass
         channel.queue_declare(queue=request_queue, durable=True)
         channel.exchange_declare(exchange=response_exchange, exchange_type='direct', durable=True)
 
-        # Create response queue
-        result = channel.queue_declare(queue='', exclusive=True)
+        # Create response queue (reclaimed by the broker 30s after last use,
+        # stale responses dropped after 15s)
+        result = channel.queue_declare(
+            queue='',
+            exclusive=True,
+            arguments={'x-expires': 30000, 'x-message-ttl': 15000}
+        )
         callback_queue = result.method.queue
         channel.queue_bind(exchange=response_exchange, queue=callback_queue, routing_key=callback_queue)
 
@@ -173,7 +285,7 @@ def test_service_roundtrip(rabbitmq_host: str, rabbitmq_user: str, rabbitmq_pass
             'request_type': 'create_memory',
             'payload': {
                 'id': test_id,
-                'emotions': [0.8] + [0.0] * 23,
+                'emotions': _EMO_RT,
                 'dominant': 'Joie',
                 'intensity': 0.8,
                 'valence': 0.9,
@@ -182,12 +294,12 @@ def test_service_roundtrip(rabbitmq_host: str, rabbitmq_user: str, rabbitmq_pass
             }
         }
 
-        print(f"  → Envoi requête: {request['request_type']} (id: {test_id[:20]}...)")
+        log.append(f"  → Envoi requête: {request['request_type']} (id: {test_id[:20]}...)")
 
         channel.basic_publish(
             exchange='',
             routing_key=request_queue,
-            body=json.dumps(request),
+            body=_dumps(request),
             properties=pika.BasicProperties(
                 reply_to=callback_queue,
                 correlation_id=request_id,
@@ -195,21 +307,24 @@ def test_service_roundtrip(rabbitmq_host: str, rabbitmq_user: str, rabbitmq_pass
             )
         )
 
-        # Wait for response
+        # Wait for response (push-based: wakes as soon as the frame arrives)
         response = None
         timeout = 10
-        start = time.time()
 
-        while time.time() - start < timeout:
-            method, props, body = channel.basic_get(callback_queue, auto_ack=True)
-            if body and props.correlation_id == request_id:
-                response = json.loads(body.decode())
-                break
-            time.sleep(0.1)
+        def on_response(ch, method, props, body):
+            nonlocal response
+            if props.correlation_id == request_id:
+                response = _loads(body)
+
+        channel.basic_consume(queue=callback_queue, on_message_callback=on_response, auto_ack=True)
+
+        deadline = time.monotonic() + timeout
+        while response is None and time.monotonic() < deadline:
+            connection.process_data_events(time_limit=max(0, deadline - time.monotonic()))
 
         if response:
             if response.get('success'):
-                print(f"    ✓ Réponse reçue: {response.get('data')}")
+                log.append(f"    ✓ Réponse reçue: {response.get('data')}")
 
                 # Cleanup: delete test memory
                 cleanup_request = {
@@ -217,27 +332,32 @@ def test_service_roundtrip(rabbitmq_host: str, rabbitmq_user: str, rabbitmq_pass
                     'request_type': 'delete_memory',
                     'payload': {'id': test_id, 'archive': False}
                 }
-                channel.basic_publish(
-                    exchange='',
-                    routing_key=request_queue,
-                    body=json.dumps(cleanup_request),
-                    properties=pika.BasicProperties(content_type='application/json')
-                )
-                print("    ✓ Nettoyage effectué")
+                try:
+                    channel.basic_publish(
+                        exchange='',
+                        routing_key=request_queue,
+                        body=_dumps(cleanup_request),
+                        properties=_JSON_PROPS
+                    )
+                    log.append("    ✓ Nettoyage effectué")
+                except pika.exceptions.NackError as e:
+                    # Best effort: the roundtrip itself succeeded
+                    log.append(f"    ⚠ Nettoyage non confirmé: {e}")
             else:
+                log.flush()
                 print(f"    ✗ Erreur service: {response.get('error')}")
-                connection.close()
                 return False
         else:
+            log.flush()
             print(f"    ✗ Timeout ({timeout}s) - le service Neo4j est-il démarré?")
-            connection.close()
             return False
 
-        connection.close()
-        print("✓ Communication RabbitMQ OK")
+        log.append("✓ Communication RabbitMQ OK")
+        log.flush()
         return True
 
     except Exception as e:
+        log.flush()
         print(f"✗ Erreur roundtrip: {e}")
         return False
 
@@ -246,44 +366,65 @@ def main():
     # Configuration
     docker_mode = '--docker' in sys.argv
 
-    if docker_mode:
-        neo4j_uri = os.getenv('NEO4J_URI', 'bolt://neo4j:7687')
-        neo4j_user = os.getenv('NEO4J_USER', 'neo4j')
-        neo4j_password = os.getenv('NEO4J_PASSWORD', '')
-        rabbitmq_host = os.getenv('RABBITMQ_HOST', 'rabbitmq')
-        rabbitmq_user = os.getenv('RABBITMQ_USER', 'virtus')
-        rabbitmq_pass = os.getenv('RABBITMQ_PASS', 'virtus@83')
-    else:
-        neo4j_uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
-        neo4j_user = os.getenv('NEO4J_USER', 'neo4j')
-        neo4j_password = os.getenv('NEO4J_PASSWORD', '')
-        rabbitmq_host = os.getenv('RABBITMQ_HOST', 'localhost')
-        rabbitmq_user = os.getenv('RABBITMQ_USER', 'virtus')
-        rabbitmq_pass = os.getenv('RABBITMQ_PASS', 'virtus@83')
-
-    print("\n" + "="*60)
+    config = IntegrationConfig.from_env(docker_mode)
+
+    print("\n" + _BANNER)
     print("    TEST INTÉGRATION NEO4J / RABBITMQ")
-    print("="*60)
+    print(_BANNER)
     print(f"Mode: {'Docker' if docker_mode else 'Local'}")
-    print(f"Neo4j: {neo4j_uri}")
-    print(f"RabbitMQ: {rabbitmq_host}")
+    print(f"Neo4j: {config.neo4j_uri}")
+    print(f"RabbitMQ: {config.rabbitmq_host}")
 
     results = []
 
-    # Run tests
-    results.append(("Neo4j Connection", test_neo4j_connection(neo4j_uri, neo4j_user, neo4j_password)))
-    results.append(("RabbitMQ Connection", test_rabbitmq_connection(rabbitmq_host, rabbitmq_user, rabbitmq_pass)))
+    # One driver for all Neo4j tests: its pool keeps the Bolt connection warm
+    driver = _make_driver(
+        config.neo4j_uri, config.neo4j_user, config.neo4j_password,
+        max_connection_pool_size=int(os.getenv('NEO4J_POOL_SIZE', '32')),
+        connection_acquisition_timeout=float(os.getenv('NEO4J_ACQ_TIMEOUT', '30'))
+    )
 
-    if results[0][1]:  # Only run CRUD if connection works
-        results.append(("Neo4j CRUD", test_neo4j_crud(neo4j_uri, neo4j_user, neo4j_password)))
+    # One Bolt session shared by the connection and CRUD tests (they never
+    # overlap: CRUD is only submitted once the connection test has returned)
+    session = driver.session()
 
-    if results[0][1] and results[1][1]:  # Only run roundtrip if both connections work
-        results.append(("Service Roundtrip", test_service_roundtrip(rabbitmq_host, rabbitmq_user, rabbitmq_pass)))
+    try:
+        with ExitStack() as stack:
+            # One AMQP connection + channel for both RabbitMQ tests
+            try:
+                channel = stack.enter_context(
+                    rabbit_channel(config.rabbitmq_host, config.rabbitmq_user, config.rabbitmq_pass)
+                )
+            except Exception as e:
+                print(f"✗ Erreur RabbitMQ: {e}")
+                channel = None
+
+            # Run tests: each one is I/O-bound on its own socket, so independent
+            # tests overlap their round-trips instead of running back to back
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                neo4j_future = executor.submit(test_neo4j_connection, session, config.neo4j_uri)
+                rabbitmq_future = executor.submit(test_rabbitmq_connection, channel, config.rabbitmq_host) if channel is not None else None
+                neo4j_ok = neo4j_future.result()
+                rabbitmq_ok = rabbitmq_future.result() if rabbitmq_future is not None else False
+                results.append(("Neo4j Connection", neo4j_ok))
+                results.append(("RabbitMQ Connection", rabbitmq_ok))
+
+                dependent = []
+                if neo4j_ok:  # Only run CRUD if connection works
+                    dependent.append(("Neo4j CRUD", executor.submit(test_neo4j_crud, session)))
+
+                if neo4j_ok and rabbitmq_ok:  # Only run roundtrip if both connections work
+                    dependent.append(("Service Roundtrip", executor.submit(test_service_roundtrip, channel)))
+
+                results.extend((name, future.result()) for name, future in dependent)
+    finally:
+        session.close()
+        driver.close()
 
     # Summary
-    print(f"\n{'='*60}")
+    print("\n" + _BANNER)
     print("RÉSUMÉ")
-    print(f"{'='*60}")
+    print(_BANNER)
 
     all_passed = True
     for name, passed in results:
@@ -292,12 +433,12 @@ def main():
         if not passed:
             all_passed = False
 
-    print(f"\n{'='*60}")
+    print("\n" + _BANNER)
     if all_passed:
         print("TOUS LES TESTS RÉUSSIS ✓")
     else:
         print("CERTAINS TESTS ONT ÉCHOUÉ ✗")
-    print(f"{'='*60}\n")
+    print(_BANNER + "\n")
 
     return 0 if all_passed else 1
 
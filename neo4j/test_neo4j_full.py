@@ -1,20 +1,102 @@
 #!/usr/bin/env python3
 """
 Test complet pour Neo4j - Teste toutes les fonctionnalités du service
-Usage: python test_neo4j_full.py [--docker]
+Usage: python test_neo4j_full.py [--docker] [--parallel | --suites]
+       TEST_VERBOSE=0 pour n'afficher que le résultat de chaque test
+       TEST_COMPRESSION=zstd pour compresser les requêtes volumineuses
+       TEST_MSGPACK=1 pour échanger requêtes et réponses en msgpack
 
 Mis à jour pour supporter le système emotional_states {sentence_id: [24 emotions]}
 """
 
+import itertools
 import json
+import multiprocessing
 import os
+import queue
 import sys
+import threading
 import time
-import uuid
 import pika
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:  # orjson optionnel : repli sur la lib standard
+    _dumps, _loads = json.dumps, json.loads
+
+
+@lru_cache(maxsize=256)
+def _gen_emotions_cached(dominant_idx: int, intensity: float) -> Tuple[float, ...]:
+    """Vecteur de 24 émotions immuable, calculé une fois par (index, intensité)"""
+    emotions = [0.0] * 24
+    emotions[dominant_idx] = intensity
+    # Ajouter un peu de bruit pour les émotions secondaires
+    emotions[(dominant_idx + 1) % 24] = intensity * 0.3
+    emotions[(dominant_idx + 2) % 24] = intensity * 0.2
+    return tuple(emotions)
+
+
+_BasicProperties = pika.BasicProperties
+
+try:
+    import zstandard
+except ImportError:  # compression optionnelle (TEST_COMPRESSION=zstd)
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:  # format binaire optionnel (TEST_MSGPACK=1)
+    msgpack = None
+
+_MSGPACK_CONTENT_TYPE = 'application/x-msgpack'
+
+# Pseudo-queue RabbitMQ des réponses RPC (Direct Reply-To)
+_DIRECT_REPLY_TO = 'amq.rabbitmq.reply-to'
+
+# Sous cette taille, la compression coûte plus qu'elle ne rapporte
+_COMPRESS_MIN_SIZE = 512
+
+
+def _encode_request(request_id: str, request_type: str, payload: Dict) -> bytes:
+    """Sérialise l'enveloppe {request_id, request_type, payload} d'une requête
+
+    request_id et request_type sont des identifiants ASCII sans caractère à
+    échapper : seule la payload passe par le sérialiseur JSON.
+    """
+    body = _dumps(payload)
+    if isinstance(body, str):  # json.dumps (repli sans orjson)
+        body = body.encode()
+    return b'{"request_id":"%s","request_type":"%s","payload":%s}' % (
+        request_id.encode(), request_type.encode(), body)
+
+
+def _encode_request_msgpack(request_id: str, request_type: str, payload: Dict) -> bytes:
+    """Sérialise l'enveloppe d'une requête en msgpack (TEST_MSGPACK=1)"""
+    return msgpack.packb({
+        'request_id': request_id,
+        'request_type': request_type,
+        'payload': payload
+    }, use_bin_type=True)
+
+
+def independent(test_func):
+    """Marque un test sans dépendance d'ordre : exécutable en parallèle"""
+    test_func.independent = True
+    return test_func
+
+
+def depends_on(*test_names):
+    """Saute le test si l'un de ses prérequis (noms de méthodes) a échoué"""
+    def decorator(test_func):
+        test_func.depends_on = test_names
+        return test_func
+    return decorator
+
 
 @dataclass
 class TestConfig:
@@ -23,18 +105,28 @@ class TestConfig:
     rabbitmq_user: str
     rabbitmq_pass: str
     request_queue: str = "neo4j.requests.queue"
-    response_exchange: str = "neo4j.responses"
     timeout: int = 15
+    workers: int = 1  # > 1 : tests @independent exécutés en parallèle
+    compression: Optional[str] = None  # 'zstd' : requêtes volumineuses compressées
+    use_msgpack: bool = False  # requêtes et réponses en msgpack au lieu de JSON
 
 
 class Neo4jTestClient:
     """Client de test pour le service Neo4j via RabbitMQ"""
 
+    # Topologie déjà déclarée dans ce processus : (hôte, queue)
+    _declared: set = set()
+
     def __init__(self, config: TestConfig):
         self.config = config
         self.connection = None
         self.channel = None
         self.callback_queue = None
+        self._responses = {}  # correlation_id -> (content_type, body)
+        # correlation_id = préfixe propre au client + compteur : unique sans uuid4,
+        # y compris entre clients (logs du service)
+        self._request_prefix = os.urandom(4).hex()
+        self._request_counter = itertools.count()
 
     def connect(self):
         """Établit la connexion RabbitMQ"""
@@ -45,90 +137,300 @@ class Neo4jTestClient:
         self.connection = pika.BlockingConnection(
             pika.ConnectionParameters(
                 host=self.config.rabbitmq_host,
-                credentials=credentials
+                credentials=credentials,
+                # Tests longs (cycle de rêve, consolidation) : pas de coupure
+                # silencieuse suivie d'une reconnexion complète
+                heartbeat=30,
+                blocked_connection_timeout=300,
+                socket_timeout=10
             )
         )
+        # Canal unique pour toute la vie du client, sans publisher confirms :
+        # la réponse RPC sert d'accusé de bout en bout (une requête perdue se
+        # traduit par un timeout), et basic_publish n'attend plus le broker,
+        # ce qui permet réellement d'enchaîner les publications d'un lot.
         self.channel = self.connection.channel()
 
-        # Déclarer les queues
-        self.channel.queue_declare(queue=self.config.request_queue, durable=True)
-        self.channel.exchange_declare(
-            exchange=self.config.response_exchange,
-            exchange_type='direct',
-            durable=True
-        )
-
-        # Queue de callback
-        result = self.channel.queue_declare(queue='', exclusive=True)
-        self.callback_queue = result.method.queue
-        self.channel.queue_bind(
-            exchange=self.config.response_exchange,
+        # Déclarer la queue des requêtes (une seule fois par processus : déclaration idempotente)
+        key = (self.config.rabbitmq_host, self.config.request_queue)
+        if key not in self._declared:
+            self.channel.queue_declare(queue=self.config.request_queue, durable=True)
+            self._declared.add(key)
+
+        # Direct Reply-To : pas de callback queue à déclarer ni à lier. Le broker
+        # remplace reply_to par un nom propre à ce canal et le service y répond
+        # via l'exchange par défaut. Le consommateur doit exister avant la
+        # première publication, et en auto-ack (imposé par le protocole).
+        self.callback_queue = _DIRECT_REPLY_TO
+        self.channel.basic_consume(
             queue=self.callback_queue,
-            routing_key=self.callback_queue
+            on_message_callback=self._on_response,
+            auto_ack=True
         )
 
+        # Références résolues une fois : _publish est appelé pour chaque requête
+        self._basic_publish = self.channel.basic_publish
+        self._request_queue = self.config.request_queue
+        self._compress = None
+        if self.config.compression not in (None, 'zstd'):
+            raise ValueError(f"TEST_COMPRESSION non supporté: {self.config.compression} (valeur acceptée: zstd)")
+        if self.config.compression == 'zstd':
+            if zstandard is None:
+                raise RuntimeError("TEST_COMPRESSION=zstd nécessite le paquet zstandard")
+            self._compress = zstandard.ZstdCompressor().compress
+        self._encode = _encode_request
+        self._content_type = 'application/json'
+        if self.config.use_msgpack:
+            if msgpack is None:
+                raise RuntimeError("TEST_MSGPACK=1 nécessite le paquet msgpack")
+            self._encode = _encode_request_msgpack
+            self._content_type = _MSGPACK_CONTENT_TYPE
+
+    def _on_response(self, ch, method, props, body):
+        """Stocke la réponse reçue sous son correlation_id"""
+        self._responses[props.correlation_id] = (props.content_type, body)
+
+    def _pop_response(self, request_id: str) -> Dict:
+        """Retire et désérialise la réponse reçue pour request_id
+
+        Le service répond dans le format de la requête (JSON ou msgpack) et
+        l'annonce dans le content_type de la réponse.
+        """
+        content_type, body = self._responses.pop(request_id)
+        if content_type == _MSGPACK_CONTENT_TYPE:
+            return msgpack.unpackb(body, raw=False)
+        return _loads(body)
+
     def close(self):
         """Ferme la connexion"""
-        if self.connection:
+        if self.connection and self.connection.is_open:
             self.connection.close()
 
-    def send_request(self, request_type: str, payload: Dict) -> Optional[Dict]:
-        """Envoie une requête et attend la réponse"""
-        request_id = str(uuid.uuid4())
+    def _publish(self, request_type: str, payload: Dict) -> str:
+        """Publie une requête sur la queue du service et retourne son request_id"""
+        request_id = f"{self._request_prefix}-{next(self._request_counter)}"
 
-        request = {
-            'request_id': request_id,
-            'request_type': request_type,
-            'payload': payload
-        }
+        body = self._encode(request_id, request_type, payload)
+        content_encoding = None
+        if self._compress is not None and len(body) > _COMPRESS_MIN_SIZE:
+            body = self._compress(body)
+            content_encoding = self.config.compression
 
-        self.channel.basic_publish(
+        self._basic_publish(
             exchange='',
-            routing_key=self.config.request_queue,
-            body=json.dumps(request),
-            properties=pika.BasicProperties(
+            routing_key=self._request_queue,
+            body=body,
+            properties=_BasicProperties(
                 reply_to=self.callback_queue,
                 correlation_id=request_id,
-                content_type='application/json'
+                content_type=self._content_type,
+                content_encoding=content_encoding
             )
         )
+        return request_id
+
+    def _wait_for(self, request_ids, timeout: float) -> bool:
+        """Traite les événements jusqu'à réception de toutes les réponses attendues"""
+        deadline = time.monotonic() + timeout
+        while not all(rid in self._responses for rid in request_ids):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self.connection.process_data_events(time_limit=remaining)
+        return True
 
-        # Attendre la réponse
-        start = time.time()
-        while time.time() - start < self.config.timeout:
-            method, props, body = self.channel.basic_get(
-                self.callback_queue, auto_ack=True
-            )
-            if body and props.correlation_id == request_id:
-                return json.loads(body.decode())
-            time.sleep(0.1)
+    def send_request(self, request_type: str, payload: Dict) -> Optional[Dict]:
+        """Envoie une requête et attend la réponse"""
+        request_id = self._publish(request_type, payload)
+
+        # Attendre la réponse : process_data_events bloque sur le socket
+        # jusqu'à l'arrivée d'une trame (pas de sommeil entre deux sondages)
+        if not self._wait_for((request_id,), self.config.timeout):
+            return None
 
-        return None
+        return self._pop_response(request_id)
+
+    def send_requests_batch(self, requests: List[Tuple[str, Dict]]) -> List[Optional[Dict]]:
+        """Publie toutes les requêtes d'un coup puis collecte les réponses
+
+        Une seule attente pour le lot au lieu d'un aller-retour par requête.
+        Le service traite les requêtes dans l'ordre de publication : une lecture
+        placée après des écritures dans le lot voit leurs effets.
+        Retourne les réponses dans l'ordre des requêtes (None si timeout).
+        """
+        request_ids = [self._publish(request_type, payload) for request_type, payload in requests]
+        self._wait_for(request_ids, self.config.timeout)
+        return [self._pop_response(rid) if rid in self._responses else None
+                for rid in request_ids]
+
+
+class ChannelPool:
+    """Pool de clients RabbitMQ pour les tests exécutés en parallèle
+
+    Un BlockingConnection pika n'est pas thread-safe : le pool contient une
+    connexion et un canal par worker (réponses reçues en Direct Reply-To sur
+    ce canal), chacun utilisé par un seul thread à la fois (acquire/release).
+    """
+
+    def __init__(self, config: TestConfig, size: int = 8):
+        self.config = config
+        self.size = size
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._clients: List[Neo4jTestClient] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Neo4jTestClient:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._clients) < self.size:
+                client = Neo4jTestClient(self.config)
+                client.connect()
+                self._clients.append(client)
+                return client
+        return self._idle.get()
+
+    def release(self, client: Neo4jTestClient):
+        self._idle.put(client)
+
+    def close(self):
+        for client in self._clients:
+            client.close()
+        self._clients.clear()
 
 
 class Neo4jFullTest:
     """Tests complets du service Neo4j"""
 
-    def __init__(self, config: TestConfig):
+    # Tests groupés par suite (ordre d'exécution). Les suites sont indépendantes
+    # les unes des autres : --suites les exécute dans des processus séparés.
+    SUITES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+        # Tests de base mémoire
+        'memory': (
+            ("Création de mémoire", 'test_create_memory'),
+            ("Création mémoire avec emotional_states", 'test_create_memory_with_emotional_states'),
+            ("Création mémoire avec relations", 'test_create_memory_with_relations'),
+            ("Récupération de mémoire", 'test_get_memory'),
+            ("Fusion de mémoires avec emotional_states", 'test_merge_memory'),
+            ("Recherche mémoires similaires", 'test_find_similar'),
+            ("Réactivation de mémoire", 'test_reactivate_memory'),
+        ),
+        # Trauma
+        'trauma': (
+            ("Création de trauma avec emotional_states", 'test_create_trauma'),
+        ),
+        # Maintenance et module Dreams
+        'dreams': (
+            ("Application du decay (oubli)", 'test_apply_decay'),
+            ("Stats MCT", 'test_mct_stats'),
+            ("Stats MLT", 'test_mlt_stats'),
+            ("Consolidation MCT → MLT", 'test_consolidation'),
+            ("Nettoyage MCT", 'test_cleanup_mct'),
+            ("Cycle de rêve complet", 'test_dream_cycle'),
+        ),
+        # Relations sémantiques
+        'relations': (
+            ("Extraction de relations", 'test_extract_relations'),
+            ("Extraction relations avec émotions", 'test_extract_relations_with_emotions'),
+        ),
+        # Concepts avec emotional_states (ordre significatif)
+        'concepts': (
+            ("Création de concept", 'test_create_concept'),
+            ("Liaison mémoire-concept", 'test_link_memory_concept'),
+            ("Concept avec analyse émotionnelle", 'test_get_concept_with_emotional_analysis'),
+            ("Concepts par mémoire", 'test_get_concepts_by_memory'),
+            ("Relations avec emotional_states", 'test_get_relations_with_emotional_states'),
+            ("Concepts par sentence_id", 'test_get_concepts_by_sentence'),
+            ("Relations par sentence_id", 'test_get_relations_by_sentence'),
+            ("Accumulation emotional_states", 'test_emotional_states_accumulation'),
+        ),
+        # Sessions
+        'sessions': (
+            ("Création de session", 'test_create_session'),
+            ("Mise à jour de session", 'test_update_session'),
+            ("Récupération de session", 'test_get_session'),
+        ),
+        # Requêtes génériques
+        'generic': (
+            ("Requête Cypher", 'test_cypher_query'),
+            ("Batch de requêtes", 'test_batch_queries'),
+        ),
+    }
+    # Table d'exécution séquentielle, calculée une fois : (libellé, méthode)
+    TESTS: Tuple[Tuple[str, str], ...] = tuple(test for suite in SUITES.values() for test in suite)
+
+    def __init__(self, config: TestConfig, first_sentence_id: int = 1):
         self.config = config
-        self.client = Neo4jTestClient(config)
-        self.test_ids = []  # Pour le nettoyage
+        self._client = Neo4jTestClient(config)
+        self._local = threading.local()  # Client du pool pour le thread courant
+        self.test_ids: set = set()  # Pour le nettoyage
         self.results = []
-        self.sentence_counter = 0  # Compteur global de sentence_ids pour les tests
+        # nom de méthode -> True (PASS), False (FAIL) ou None (SKIP) ; voir depends_on
+        self._outcomes: Dict[str, Optional[bool]] = {}
+        # sentence_ids des tests : next() sur itertools.count est atomique, sans verrou
+        self._sentence_ids = itertools.count(first_sentence_id)
+        # TEST_VERBOSE=0 : détails des tests non formatés (CI)
+        self.verbose = os.environ.get('TEST_VERBOSE', '1') == '1'
+        # Identifiants de test : sel aléatoire tiré une fois + compteur
+        self._id_prefix = os.urandom(3).hex()
+        self._id_counter = itertools.count()
+
+    @property
+    def client(self) -> Neo4jTestClient:
+        """Client du thread courant (pool en parallèle, sinon client principal)"""
+        return getattr(self._local, 'client', None) or self._client
+
+    def _log(self, message):
+        """Affiche message() en mode verbeux (lambda : formatage évité sinon)"""
+        if self.verbose:
+            self._write(message())
+
+    def _write(self, line: str):
+        """Ajoute une ligne à la sortie du test en cours (écrite en une fois)"""
+        lines = getattr(self._local, 'lines', None)
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
+
+    def new_id(self) -> str:
+        """Suffixe unique pour les ids de test (triable, sans appel système)"""
+        return f"{self._id_prefix}{next(self._id_counter):05x}"
 
     def get_next_sentence_id(self) -> int:
         """Retourne le prochain sentence_id pour les tests"""
-        self.sentence_counter += 1
-        return self.sentence_counter
-
-    def generate_emotions(self, dominant_idx: int = 0, intensity: float = 0.8) -> List[float]:
-        """Génère un vecteur de 24 émotions avec une émotion dominante"""
-        emotions = [0.0] * 24
-        emotions[dominant_idx] = intensity
-        # Ajouter un peu de bruit pour les émotions secondaires
-        emotions[(dominant_idx + 1) % 24] = intensity * 0.3
-        emotions[(dominant_idx + 2) % 24] = intensity * 0.2
-        return emotions
+        return next(self._sentence_ids)
+
+    def new_memory(self, prefix: str, emotions, dominant: str, intensity: float,
+                   valence: float, weight: float, **extra) -> Dict:
+        """Payload create_memory d'une nouvelle mémoire de test
+
+        L'id (prefix + new_id) est enregistré pour le nettoyage et reçoit le
+        prochain sentence_id ; extra complète le payload (context...).
+        """
+        memory_id = f"{prefix}_{self.new_id()}"
+        self.test_ids.add(memory_id)
+        memory = {
+            'id': memory_id,
+            'sentence_id': self.get_next_sentence_id(),
+            'emotions': emotions,
+            'dominant': dominant,
+            'intensity': intensity,
+            'valence': valence,
+            'weight': weight
+        }
+        memory.update(extra)
+        return memory
+
+    def generate_emotions(self, dominant_idx: int = 0, intensity: float = 0.8) -> Tuple[float, ...]:
+        """Génère un vecteur de 24 émotions avec une émotion dominante
+
+        Le tuple retourné est partagé (mis en cache) : le copier avec list()
+        avant toute modification. json.dumps le sérialise tel quel.
+        """
+        return _gen_emotions_cached(dominant_idx, round(intensity, 3))
 
     def setup(self):
         """Initialisation"""
@@ -144,10 +446,14 @@ class Neo4jFullTest:
         })
         if warmup_response is None:
             print("  ⚠ Warmup timeout - le service peut être lent au démarrage")
-            # Réessayer une fois
-            import time
-            time.sleep(2)
-            self.client.send_request('cypher_query', {'query': 'RETURN 1'})
+            # Réessayer avec un délai doublé à chaque tentative :
+            # 0.25 s, 0.5 s, 1 s puis 2 s (3.75 s d'attente au plus)
+            delay = 0.25
+            for _ in range(4):
+                time.sleep(delay)
+                if self.client.send_request('cypher_query', {'query': 'RETURN 1'}) is not None:
+                    break
+                delay *= 2
         print("")
 
     def teardown(self):
@@ -155,54 +461,103 @@ class Neo4jFullTest:
         print("\n" + "-" * 70)
         print("NETTOYAGE...")
 
-        # Supprimer tous les éléments de test
-        for test_id in self.test_ids:
-            self.client.send_request('delete_memory', {
-                'id': test_id,
-                'archive': False
-            })
+        self.cleanup_ids()
 
         # Supprimer les sessions de test
         self.client.send_request('cypher_query', {
-            'query': "MATCH (s:Session) WHERE s.id STARTS WITH 'TEST_' DETACH DELETE s"
+            'query': "MATCH (s:Session) WHERE s.id STARTS WITH $prefix DETACH DELETE s",
+            'params': {'prefix': 'TEST_'}
         })
 
         # Supprimer les concepts de test
         self.client.send_request('cypher_query', {
-            'query': "MATCH (c:Concept) WHERE c.name STARTS WITH 'test_' DETACH DELETE c"
+            'query': "MATCH (c:Concept) WHERE c.name STARTS WITH $prefix DETACH DELETE c",
+            'params': {'prefix': 'test_'}
         })
 
         self.client.close()
         print("Nettoyage terminé")
 
+    def cleanup_ids(self):
+        """Supprime les mémoires créées par ce processus (une seule requête paramétrée)"""
+        if self.test_ids:
+            self.client.send_request('cypher_query', {
+                'query': "UNWIND $ids AS id MATCH (m:Memory {id: id}) DETACH DELETE m",
+                'params': {'ids': list(self.test_ids)}
+            })
+            self.test_ids.clear()
+
     def run_test(self, name: str, test_func):
         """Exécute un test et capture le résultat"""
-        print(f"\n{'─' * 70}")
-        print(f"TEST: {name}")
-        print(f"{'─' * 70}")
+        self.results.append((name, self._execute_test(name, test_func)))
+
+    def _execute_test(self, name: str, test_func) -> Optional[bool]:
+        """Exécute un test et retourne son succès (None s'il est sauté)
 
+        La sortie du test est accumulée puis écrite en un seul appel : une
+        écriture par test, et pas d'entrelacement entre tests parallèles.
+        """
+        lines = self._local.lines = [f"\n{'─' * 70}", f"TEST: {name}", '─' * 70]
+        success = False
         try:
-            success = test_func()
-            if success:
-                print("\n✓ PASS")
-                self.results.append((name, True))
-            else:
-                print("\n✗ FAIL")
-                self.results.append((name, False))
+            # Prérequis en échec ou sauté : inutile de solliciter le service
+            failed = [dep for dep in getattr(test_func, 'depends_on', ())
+                      if dep in self._outcomes and not self._outcomes[dep]]
+            if failed:
+                success = None
+                lines.append(f"\n⊘ SKIP - prérequis en échec: {', '.join(failed)}")
+                return success
+
+            success = bool(test_func())
+            lines.append("\n✓ PASS" if success else "\n✗ FAIL")
+            return success
         except Exception as e:
-            print(f"\n✗ FAIL - Exception: {e}")
-            self.results.append((name, False))
+            lines.append(f"\n✗ FAIL - Exception: {e}")
+            return success
+        finally:
+            self._outcomes[test_func.__name__] = success
+            self._local.lines = None
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def _execute_pooled(self, pool: ChannelPool, name: str, test_func) -> Optional[bool]:
+        """Exécute un test avec un client emprunté au pool"""
+        client = pool.acquire()
+        self._local.client = client
+        try:
+            return self._execute_test(name, test_func)
+        finally:
+            self._local.client = None
+            pool.release(client)
+
+    def run_parallel(self, tests: List[Tuple[str, Any]]):
+        """Exécute des tests indépendants sur un pool de clients
+
+        Les résultats sont enregistrés dans l'ordre de soumission.
+        """
+        workers = min(self.config.workers, len(tests))
+        pool = ChannelPool(self.config, size=workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [(name, executor.submit(self._execute_pooled, pool, name, func))
+                           for name, func in tests]
+                for name, future in futures:
+                    self.results.append((name, future.result()))
+        finally:
+            pool.close()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TESTS DE BASE - MÉMOIRE
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @independent
     def test_create_memory(self):
         """Test création de mémoire basique"""
-        memory_id = f"TEST_MEM_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
+        memory_id = f"TEST_MEM_{self.new_id()}"
+        self.test_ids.add(memory_id)
 
-        # Retry logic pour le cold start
+        # Retry logic pour le cold start (0.5 s puis 1 s entre tentatives)
+        delay = 0.5
         for attempt in range(3):
             response = self.client.send_request('create_memory', {
                 'id': memory_id,
@@ -216,244 +571,202 @@ class Neo4jFullTest:
             
             if response and response.get('success'):
                 data = response.get('data', {})
-                print(f"  → Mémoire créée: {data.get('id')}")
-                print(f"  → Mots-clés extraits: {data.get('keywords_extracted')}")
+                self._log(lambda: f"  → Mémoire créée: {data.get('id')}")
+                self._log(lambda: f"  → Mots-clés extraits: {data.get('keywords_extracted')}")
                 return True
             
             if attempt < 2:
-                print(f"  → Tentative {attempt + 1} timeout, retry...")
-                time.sleep(1)
+                self._log(lambda: f"  → Tentative {attempt + 1} timeout, retry...")
+                time.sleep(delay)
+                delay *= 2
 
-        print(f"  → Erreur après 3 tentatives: {response}")
+        self._write(f"  → Erreur après 3 tentatives: {response}")
         return False
 
+    @independent
     def test_create_memory_with_emotional_states(self):
         """Test création mémoire avec emotional_states explicite"""
-        memory_id = f"TEST_MEM_ES_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(0, 0.9)  # Joie forte
+        memory = self.new_memory(
+            'TEST_MEM_ES', self.generate_emotions(0, 0.9),  # Joie forte
+            'Joie', intensity=0.9, valence=0.95, weight=0.6,
+            context="Dans le parc, j'ai observé des canards paisibles.")
+        sentence_id = memory['sentence_id']
 
-        response = self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Joie',
-            'intensity': 0.9,
-            'valence': 0.95,
-            'weight': 0.6,
-            'context': "Dans le parc, j'ai observé des canards paisibles.",
-        })
+        response = self.client.send_request('create_memory', memory)
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Mémoire créée: {data.get('id')}")
-            print(f"  → Sentence ID: {sentence_id}")
-            print(f"  → Mots-clés: {data.get('keywords_extracted')}")
-            print(f"  → Emotional states: {list(data.get('emotional_states', {}).keys())}")
-            print(f"  → Relations créées: {data.get('relations_created')}")
+            self._log(lambda: f"  → Mémoire créée: {data.get('id')}")
+            self._log(lambda: f"  → Sentence ID: {sentence_id}")
+            self._log(lambda: f"  → Mots-clés: {data.get('keywords_extracted')}")
+            self._log(lambda: f"  → Emotional states: {list(data.get('emotional_states', {}).keys())}")
+            self._log(lambda: f"  → Relations créées: {data.get('relations_created')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @independent
     def test_create_memory_with_relations(self):
         """Test création mémoire avec extraction de relations"""
-        memory_id = f"TEST_REL_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(1, 0.7)  # Confiance
+        memory = self.new_memory(
+            'TEST_REL', self.generate_emotions(1, 0.7),  # Confiance
+            'Confiance', intensity=0.8, valence=0.7, weight=0.6,
+            context="Marie aime les chats. Le chat dort sur le canapé.")
 
-        response = self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Confiance',
-            'intensity': 0.8,
-            'valence': 0.7,
-            'weight': 0.6,
-            'context': "Marie aime les chats. Le chat dort sur le canapé.",
-        })
+        response = self.client.send_request('create_memory', memory)
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Mémoire créée: {data.get('id')}")
-            print(f"  → Mots-clés: {data.get('keywords_extracted')}")
-            print(f"  → Relations créées: {data.get('relations_created')}")
+            self._log(lambda: f"  → Mémoire créée: {data.get('id')}")
+            self._log(lambda: f"  → Mots-clés: {data.get('keywords_extracted')}")
+            self._log(lambda: f"  → Relations créées: {data.get('relations_created')}")
             return data.get('relations_created', 0) > 0
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @depends_on('test_create_memory')
     def test_get_memory(self):
         """Test récupération de mémoire avec emotional_states"""
-        memory_id = f"TEST_GET_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(16, 0.95)  # Extase
+        memory = self.new_memory(
+            'TEST_GET', self.generate_emotions(16, 0.95),  # Extase
+            'Extase', intensity=0.95, valence=1.0, weight=0.8)
 
-        # Créer
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Extase',
-            'intensity': 0.95,
-            'valence': 1.0,
-            'weight': 0.8
-        })
-
-        # Récupérer
-        response = self.client.send_request('get_memory', {'id': memory_id})
+        # Créer puis récupérer, dans le même lot
+        _, response = self.client.send_requests_batch([
+            ('create_memory', memory),
+            ('get_memory', {'id': memory['id']}),
+        ])
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → ID: {data.get('id')}")
-            print(f"  → Dominant: {data.get('dominant')}")
-            print(f"  → Intensité: {data.get('intensity')}")
-            print(f"  → Valence: {data.get('valence')}")
-            print(f"  → Poids: {data.get('weight')}")
-            print(f"  → Sentence IDs: {data.get('sentence_ids')}")
+            self._log(lambda: f"  → ID: {data.get('id')}")
+            self._log(lambda: f"  → Dominant: {data.get('dominant')}")
+            self._log(lambda: f"  → Intensité: {data.get('intensity')}")
+            self._log(lambda: f"  → Valence: {data.get('valence')}")
+            self._log(lambda: f"  → Poids: {data.get('weight')}")
+            self._log(lambda: f"  → Sentence IDs: {data.get('sentence_ids')}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states keys: {list(es.keys())}")
+            self._log(lambda: f"  → Emotional states keys: {list(es.keys())}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @depends_on('test_create_memory')
     def test_merge_memory(self):
         """Test fusion de mémoires avec emotional_states"""
-        memory_id = f"TEST_MERGE_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id_1 = self.get_next_sentence_id()
+        memory = self.new_memory(
+            'TEST_MERGE', self.generate_emotions(0, 0.7),  # Joie
+            'Joie', intensity=0.7, valence=0.8, weight=0.5)
+        sentence_id_1 = memory['sentence_id']
         sentence_id_2 = self.get_next_sentence_id()
-        
-        emotions_1 = self.generate_emotions(0, 0.7)  # Joie
-        emotions_2 = self.generate_emotions(8, 0.6)  # Sérénité
 
-        # Créer mémoire initiale
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id_1,
-            'emotions': emotions_1,
-            'dominant': 'Joie',
-            'intensity': 0.7,
-            'valence': 0.8,
-            'weight': 0.5
-        })
+        emotions_2 = self.generate_emotions(8, 0.6)  # Sérénité
 
-        # Fusionner avec nouvelles émotions
-        response = self.client.send_request('merge_memory', {
-            'target_id': memory_id,
-            'emotions': emotions_2,
-            'sentence_id': sentence_id_2,
-            'transfer_weight': 0.2
-        })
+        # Créer la mémoire initiale puis fusionner les nouvelles émotions
+        _, response = self.client.send_requests_batch([
+            ('create_memory', memory),
+            ('merge_memory', {
+                'target_id': memory['id'],
+                'emotions': emotions_2,
+                'sentence_id': sentence_id_2,
+                'transfer_weight': 0.2
+            }),
+        ])
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Nouveau poids: {data.get('new_weight')}")
-            print(f"  → Nombre de fusions: {data.get('merge_count')}")
+            self._log(lambda: f"  → Nouveau poids: {data.get('new_weight')}")
+            self._log(lambda: f"  → Nombre de fusions: {data.get('merge_count')}")
             sentence_ids = data.get('sentence_ids', [])
-            print(f"  → Sentence IDs fusionnés: {sentence_ids}")
+            self._log(lambda: f"  → Sentence IDs fusionnés: {sentence_ids}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states: {len(es)} états")
+            self._log(lambda: f"  → Emotional states: {len(es)} états")
             
             # Vérifier que les deux sentence_ids sont présents
-            has_both = str(sentence_id_1) in [str(k) for k in es.keys()] or str(sentence_id_2) in [str(k) for k in es.keys()]
+            keys_str = {str(k) for k in es}
+            has_both = bool(keys_str & {str(sentence_id_1), str(sentence_id_2)})
             return has_both or len(sentence_ids) >= 1
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @depends_on('test_create_memory')
     def test_find_similar(self):
         """Test recherche mémoires similaires"""
         # Créer plusieurs mémoires avec des profils émotionnels
         base_emotions = self.generate_emotions(0, 0.9)  # Joie forte
         
-        memory_ids = []
-        for i in range(3):
-            mem_id = f"TEST_SIM_{uuid.uuid4().hex[:8]}"
-            memory_ids.append(mem_id)
-            self.test_ids.append(mem_id)
-            
-            self.client.send_request('create_memory', {
-                'id': mem_id,
-                'sentence_id': self.get_next_sentence_id(),
-                'emotions': base_emotions,
-                'dominant': 'Joie',
-                'intensity': 0.9 - i * 0.1,
-                'valence': 0.9,
-                'weight': 0.7
-            })
+        batch = [
+            self.new_memory('TEST_SIM', base_emotions, 'Joie',
+                            intensity=0.9 - i * 0.1, valence=0.9, weight=0.7)
+            for i in range(3)
+        ]
 
-        # Rechercher des mémoires similaires (seuil bas pour garantir des résultats)
-        response = self.client.send_request('find_similar', {
-            'emotions': base_emotions,
-            'threshold': 0.5,  # Seuil abaissé
-            'limit': 10
-        })
+        # Une seule requête (UNWIND côté service) pour les trois créations, suivie
+        # de la recherche (seuil bas pour garantir des résultats)
+        created, response = self.client.send_requests_batch([
+            ('batch_create_memory', {'items': batch}),
+            ('find_similar', {
+                'emotions': base_emotions,
+                'threshold': 0.5,  # Seuil abaissé
+                'limit': 10
+            }),
+        ])
+        if not created or not created.get('success'):
+            self._write(f"  ⚠ Création groupée non confirmée: {created}")
 
         if response and response.get('success'):
             data = response.get('data', [])
-            print(f"  → Mémoires similaires trouvées: {len(data)}")
+            self._log(lambda: f"  → Mémoires similaires trouvées: {len(data)}")
             for mem in data[:3]:
-                print(f"    - {mem.get('id')}: similarité={mem.get('similarity', 0):.3f}")
+                self._log(lambda: f"    - {mem.get('id')}: similarité={mem.get('similarity', 0):.3f}")
             # Accepter même 0 résultats si la requête a réussi
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @depends_on('test_create_memory')
     def test_reactivate_memory(self):
         """Test réactivation de mémoire"""
-        memory_id = f"TEST_REACT_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-
-        # Créer
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': self.generate_emotions(0, 0.5),
-            'dominant': 'Joie',
-            'intensity': 0.5,
-            'valence': 0.6,
-            'weight': 0.3
-        })
-
-        # Réactiver
-        response = self.client.send_request('reactivate', {
-            'id': memory_id,
-            'strength': 1.0,
-            'boost_factor': 0.2
-        })
+        memory = self.new_memory(
+            'TEST_REACT', self.generate_emotions(0, 0.5),
+            'Joie', intensity=0.5, valence=0.6, weight=0.3)
+
+        # Créer puis réactiver
+        _, response = self.client.send_requests_batch([
+            ('create_memory', memory),
+            ('reactivate', {
+                'id': memory['id'],
+                'strength': 1.0,
+                'boost_factor': 0.2
+            }),
+        ])
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Nouveau poids: {data.get('new_weight')}")
-            print(f"  → Activations: {data.get('activations')}")
-            print(f"  → Sentence IDs: {data.get('sentence_ids')}")
+            self._log(lambda: f"  → Nouveau poids: {data.get('new_weight')}")
+            self._log(lambda: f"  → Activations: {data.get('activations')}")
+            self._log(lambda: f"  → Sentence IDs: {data.get('sentence_ids')}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states: {len(es)} états")
+            self._log(lambda: f"  → Emotional states: {len(es)} états")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TESTS TRAUMA
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @independent
     def test_create_trauma(self):
         """Test création de trauma avec emotional_states"""
-        trauma_id = f"TEST_TRAUMA_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(trauma_id)
+        trauma_id = f"TEST_TRAUMA_{self.new_id()}"
+        self.test_ids.add(trauma_id)
         
         sentence_id = self.get_next_sentence_id()
         emotions = self.generate_emotions(2, 0.95)  # Peur intense
@@ -471,14 +784,14 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Trauma créé: {data.get('id')}")
-            print(f"  → Déclencheurs: {data.get('trigger_keywords')}")
-            print(f"  → Sentence ID: {data.get('sentence_id')}")
+            self._log(lambda: f"  → Trauma créé: {data.get('id')}")
+            self._log(lambda: f"  → Déclencheurs: {data.get('trigger_keywords')}")
+            self._log(lambda: f"  → Sentence ID: {data.get('sentence_id')}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states: {list(es.keys())}")
+            self._log(lambda: f"  → Emotional states: {list(es.keys())}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -495,44 +808,46 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Mémoires normales mises à jour: {data.get('normal_updated')}")
-            print(f"  → Traumas mis à jour: {data.get('trauma_updated')}")
-            print(f"  → Mémoires archivées: {data.get('archived')}")
+            self._log(lambda: f"  → Mémoires normales mises à jour: {data.get('normal_updated')}")
+            self._log(lambda: f"  → Traumas mis à jour: {data.get('trauma_updated')}")
+            self._log(lambda: f"  → Mémoires archivées: {data.get('archived')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TESTS MODULE DREAMS
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @independent
     def test_mct_stats(self):
         """Test stats MCT"""
         response = self.client.send_request('get_mct_stats', {})
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Type: {data.get('type')}")
-            print(f"  → Total: {data.get('total_count')}")
-            print(f"  → Poids moyen: {data.get('avg_weight', 0):.3f}")
+            self._log(lambda: f"  → Type: {data.get('type')}")
+            self._log(lambda: f"  → Total: {data.get('total_count')}")
+            self._log(lambda: f"  → Poids moyen: {data.get('avg_weight', 0):.3f}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @independent
     def test_mlt_stats(self):
         """Test stats MLT"""
         response = self.client.send_request('get_mlt_stats', {})
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Type: {data.get('type')}")
-            print(f"  → Total: {data.get('total_count')}")
-            print(f"  → Par catégorie: {data.get('by_category', {})}")
+            self._log(lambda: f"  → Type: {data.get('type')}")
+            self._log(lambda: f"  → Total: {data.get('total_count')}")
+            self._log(lambda: f"  → Par catégorie: {data.get('by_category', {})}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     def test_consolidation(self):
@@ -543,10 +858,10 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Consolidés: {data.get('consolidated_count')}")
+            self._log(lambda: f"  → Consolidés: {data.get('consolidated_count')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     def test_cleanup_mct(self):
@@ -558,12 +873,12 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Archivés: {data.get('archived')}")
-            print(f"  → Supprimés: {data.get('deleted')}")
-            print(f"  → Désactivés: {data.get('working_deactivated')}")
+            self._log(lambda: f"  → Archivés: {data.get('archived')}")
+            self._log(lambda: f"  → Supprimés: {data.get('deleted')}")
+            self._log(lambda: f"  → Désactivés: {data.get('working_deactivated')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     def test_dream_cycle(self):
@@ -576,12 +891,12 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Cycle complété: {data.get('dream_cycle_completed')}")
-            print(f"  → Consolidation: {data.get('consolidation', {}).get('consolidated_count', 0)}")
-            print(f"  → Liens MLT renforcés: {data.get('reinforced_mlt_links')}")
+            self._log(lambda: f"  → Cycle complété: {data.get('dream_cycle_completed')}")
+            self._log(lambda: f"  → Consolidation: {data.get('consolidation', {}).get('consolidated_count', 0)}")
+            self._log(lambda: f"  → Liens MLT renforcés: {data.get('reinforced_mlt_links')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -602,15 +917,15 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Mots-clés: {data.get('keywords')}")
-            print(f"  → Relations: {data.get('relations')}")
-            print(f"  → Sentence ID: {data.get('sentence_id')}")
+            self._log(lambda: f"  → Mots-clés: {data.get('keywords')}")
+            self._log(lambda: f"  → Relations: {data.get('relations')}")
+            self._log(lambda: f"  → Sentence ID: {data.get('sentence_id')}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states: {list(es.keys())}")
-            print(f"  → Stockées: {data.get('stored')}")
+            self._log(lambda: f"  → Emotional states: {list(es.keys())}")
+            self._log(lambda: f"  → Stockées: {data.get('stored')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     def test_extract_relations_with_emotions(self):
@@ -627,15 +942,15 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Mots-clés: {data.get('keywords')}")
-            print(f"  → Relations: {data.get('relations')}")
-            print(f"  → Sentence ID: {sentence_id}")
+            self._log(lambda: f"  → Mots-clés: {data.get('keywords')}")
+            self._log(lambda: f"  → Relations: {data.get('relations')}")
+            self._log(lambda: f"  → Sentence ID: {sentence_id}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states: {list(es.keys())}")
-            print(f"  → Stockées: {data.get('stored')}")
+            self._log(lambda: f"  → Emotional states: {list(es.keys())}")
+            self._log(lambda: f"  → Stockées: {data.get('stored')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -659,242 +974,165 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Concept créé: {data.get('name')}")
-            print(f"  → Sentence IDs: {data.get('sentence_ids')}")
+            self._log(lambda: f"  → Concept créé: {data.get('name')}")
+            self._log(lambda: f"  → Sentence IDs: {data.get('sentence_ids')}")
             es = data.get('emotional_states', {})
-            print(f"  → Emotional states: {list(es.keys())}")
+            self._log(lambda: f"  → Emotional states: {list(es.keys())}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
-    def test_link_memory_concept(self):
-        """Test liaison mémoire-concept avec propagation emotional_states"""
-        memory_id = f"TEST_LINK_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(1, 0.7)  # Confiance
-
-        # Créer mémoire
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Confiance',
-            'intensity': 0.7,
-            'valence': 0.8,
-            'weight': 0.6
-        })
+    def _create_and_query(self, prefix: str, dominant_idx: int, dominant: str,
+                          intensity: float, valence: float, weight: float,
+                          context: Optional[str], query_type: str,
+                          by: Optional[str] = 'memory_id', **query) -> Tuple[int, Optional[Dict]]:
+        """Crée une mémoire de test puis envoie la requête query_type
+
+        La création et la requête partent dans le même lot (traitées dans l'ordre).
+        by ('memory_id', 'sentence_id' ou None) ajoute l'id créé au payload.
+        Retourne (sentence_id, réponse) ; réponse vaut None en cas d'échec.
+        """
+        memory = self.new_memory(prefix, self.generate_emotions(dominant_idx, intensity),
+                                 dominant, intensity, valence, weight)
+        sentence_id = memory['sentence_id']
+        if context:
+            memory['context'] = context
+        if by:
+            query[by] = memory['id'] if by == 'memory_id' else sentence_id
+
+        _, response = self.client.send_requests_batch([
+            ('create_memory', memory),
+            (query_type, query),
+        ])
+        if response and response.get('success'):
+            return sentence_id, response
 
-        # Lier au concept
-        response = self.client.send_request('link_memory_concept', {
-            'memory_id': memory_id,
-            'concept_name': 'test_famille',
-            'relation': 'ASSOCIE_A'
-        })
+        self._write(f"  → Erreur: {response}")
+        return sentence_id, None
 
-        if response and response.get('success'):
-            data = response.get('data', {})
-            print(f"  → Mémoire: {data.get('memory')}")
-            print(f"  → Concept: {data.get('concept')}")
-            print(f"  → Relation: {data.get('relation')}")
-            print(f"  → Memory sentence_ids: {data.get('memory_sentence_ids')}")
-            print(f"  → Concept sentence_ids: {data.get('concept_sentence_ids')}")
-            return True
+    @depends_on('test_create_memory')
+    def test_link_memory_concept(self):
+        """Test liaison mémoire-concept avec propagation emotional_states"""
+        _, response = self._create_and_query(
+            'TEST_LINK', 1, 'Confiance', 0.7, 0.8, 0.6, None,
+            'link_memory_concept', concept_name='test_famille', relation='ASSOCIE_A'
+        )
+        if response is None:
+            return False
 
-        print(f"  → Erreur: {response}")
-        return False
+        data = response.get('data', {})
+        self._log(lambda: f"  → Mémoire: {data.get('memory')}")
+        self._log(lambda: f"  → Concept: {data.get('concept')}")
+        self._log(lambda: f"  → Relation: {data.get('relation')}")
+        self._log(lambda: f"  → Memory sentence_ids: {data.get('memory_sentence_ids')}")
+        self._log(lambda: f"  → Concept sentence_ids: {data.get('concept_sentence_ids')}")
+        return True
 
+    @depends_on('test_create_memory')
     def test_get_concept_with_emotional_analysis(self):
         """Test concept avec IDs et analyse émotionnelle"""
-        memory_id = f"TEST_CONCEPT_IDS_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(0, 0.9)  # Joie forte
-
-        # Créer une mémoire qui évoque un concept
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Joie',
-            'intensity': 0.9,
-            'valence': 0.95,
-            'weight': 0.8,
-            'context': "Le soleil brille sur la plage."
-        })
-
-        # Récupérer le concept 'soleil'
-        response = self.client.send_request('get_concept', {
-            'name': 'soleil'
-        })
-
-        if response and response.get('success'):
-            data = response.get('data', {})
-            print(f"  → Concept: {data.get('name')}")
-            print(f"  → Memory IDs: {data.get('memory_ids')}")
-            print(f"  → Sentence IDs: {data.get('sentence_ids')}")
-            print(f"  → Linked memories: {data.get('linked_memories')}")
-            analysis = data.get('emotional_analysis', {})
-            if analysis:
-                print(f"  → Analyse émotionnelle:")
-                print(f"      - Dominant: {analysis.get('dominant_emotion')}")
-                print(f"      - Valence moy: {analysis.get('avg_valence', 0):.2f}")
-                print(f"      - Stabilité: {analysis.get('stability', 0):.2f}")
-                print(f"      - Trajectoire: {analysis.get('trajectory')}")
-            return True
+        # Une mémoire qui évoque le concept 'soleil'
+        _, response = self._create_and_query(
+            'TEST_CONCEPT_IDS', 0, 'Joie', 0.9, 0.95, 0.8, "Le soleil brille sur la plage.",
+            'get_concept', by=None, name='soleil'
+        )
+        if response is None:
+            return False
 
-        print(f"  → Erreur: {response}")
-        return False
+        data = response.get('data', {})
+        self._log(lambda: f"  → Concept: {data.get('name')}")
+        self._log(lambda: f"  → Memory IDs: {data.get('memory_ids')}")
+        self._log(lambda: f"  → Sentence IDs: {data.get('sentence_ids')}")
+        self._log(lambda: f"  → Linked memories: {data.get('linked_memories')}")
+        analysis = data.get('emotional_analysis', {})
+        if analysis:
+            self._log(lambda: f"  → Analyse émotionnelle:")
+            self._log(lambda: f"      - Dominant: {analysis.get('dominant_emotion')}")
+            self._log(lambda: f"      - Valence moy: {analysis.get('avg_valence', 0):.2f}")
+            self._log(lambda: f"      - Stabilité: {analysis.get('stability', 0):.2f}")
+            self._log(lambda: f"      - Trajectoire: {analysis.get('trajectory')}")
+        return True
 
+    @depends_on('test_create_memory')
     def test_get_concepts_by_memory(self):
         """Test récupération des concepts d'une mémoire avec emotional_states"""
-        memory_id = f"TEST_CONCEPTS_MEM_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(8, 0.7)  # Sérénité
-
-        # Créer une mémoire riche
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Sérénité',
-            'intensity': 0.7,
-            'valence': 0.8,
-            'weight': 0.6,
-            'context': "Les enfants jouent dans le jardin fleuri."
-        })
-
-        response = self.client.send_request('get_concepts_by_memory', {
-            'memory_id': memory_id
-        })
-
-        if response and response.get('success'):
-            data = response.get('data', [])
-            print(f"  → Concepts trouvés: {len(data)}")
-            for c in data[:5]:
-                print(f"    - {c.get('name')}: memory_ids={c.get('memory_ids')}, sentence_ids={c.get('sentence_ids')}")
-                analysis = c.get('emotional_analysis', {})
-                if analysis:
-                    print(f"      → Dominant: {analysis.get('dominant_emotion')}, Valence: {analysis.get('avg_valence', 0):.2f}")
-            return len(data) > 0
+        _, response = self._create_and_query(
+            'TEST_CONCEPTS_MEM', 8, 'Sérénité', 0.7, 0.8, 0.6,
+            "Les enfants jouent dans le jardin fleuri.", 'get_concepts_by_memory', limit=5
+        )
+        if response is None:
+            return False
 
-        print(f"  → Erreur: {response}")
-        return False
+        data = response.get('data', [])
+        self._log(lambda: f"  → Concepts trouvés: {len(data)}")
+        for c in data[:5]:
+            self._log(lambda: f"    - {c.get('name')}: memory_ids={c.get('memory_ids')}, sentence_ids={c.get('sentence_ids')}")
+            analysis = c.get('emotional_analysis', {})
+            if analysis:
+                self._log(lambda: f"      → Dominant: {analysis.get('dominant_emotion')}, Valence: {analysis.get('avg_valence', 0):.2f}")
+        return len(data) > 0
 
+    @depends_on('test_create_memory')
     def test_get_relations_with_emotional_states(self):
         """Test récupération des relations avec emotional_states"""
-        memory_id = f"TEST_REL_IDS_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(0, 0.8)  # Joie
-
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Joie',
-            'intensity': 0.8,
-            'valence': 0.85,
-            'weight': 0.7,
-            'context': "Le chat dort sur le canapé."
-        })
-
-        response = self.client.send_request('get_relations_with_ids', {
-            'memory_id': memory_id
-        })
-
-        if response and response.get('success'):
-            data = response.get('data', [])
-            print(f"  → Relations trouvées: {len(data)}")
-            for r in data[:3]:
-                src_ids = r.get('source_sentence_ids', [])
-                tgt_ids = r.get('target_sentence_ids', [])
-                print(f"    - '{r.get('source')}' sent_ids:{src_ids} "
-                      f"--[{r.get('relation')}]--> "
-                      f"'{r.get('target')}' sent_ids:{tgt_ids}")
-            return True
+        _, response = self._create_and_query(
+            'TEST_REL_IDS', 0, 'Joie', 0.8, 0.85, 0.7,
+            "Le chat dort sur le canapé.", 'get_relations_with_ids'
+        )
+        if response is None:
+            return False
 
-        print(f"  → Erreur: {response}")
-        return False
+        data = response.get('data', [])
+        self._log(lambda: f"  → Relations trouvées: {len(data)}")
+        for r in data[:3]:
+            src_ids = r.get('source_sentence_ids', [])
+            tgt_ids = r.get('target_sentence_ids', [])
+            self._log(lambda: f"    - '{r.get('source')}' sent_ids:{src_ids} "
+                              f"--[{r.get('relation')}]--> "
+                              f"'{r.get('target')}' sent_ids:{tgt_ids}")
+        return True
 
+    @depends_on('test_create_memory')
     def test_get_concepts_by_sentence(self):
         """Test récupération des concepts par sentence_id avec émotions"""
-        memory_id = f"TEST_SENT_CONCEPT_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(7, 0.75)  # Anticipation
-
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Anticipation',
-            'intensity': 0.75,
-            'valence': 0.7,
-            'weight': 0.65,
-            'context': "Le chien court dans le jardin."
-        })
-
-        response = self.client.send_request('get_concepts_by_sentence', {
-            'sentence_id': sentence_id
-        })
+        sentence_id, response = self._create_and_query(
+            'TEST_SENT_CONCEPT', 7, 'Anticipation', 0.75, 0.7, 0.65,
+            "Le chien court dans le jardin.", 'get_concepts_by_sentence', by='sentence_id'
+        )
+        if response is None:
+            return False
 
-        if response and response.get('success'):
-            data = response.get('data', [])
-            print(f"  → Concepts pour sentence_id={sentence_id}: {len(data)}")
-            for c in data:
-                efs = c.get('emotions_for_sentence', [])
-                print(f"    - {c.get('name')}: sentence_ids={c.get('sentence_ids')}")
-                if efs:
-                    print(f"      → Émotions de cette phrase: {efs[:3]}...")
-            return len(data) > 0
-
-        print(f"  → Erreur: {response}")
-        return False
+        data = response.get('data', [])
+        self._log(lambda: f"  → Concepts pour sentence_id={sentence_id}: {len(data)}")
+        for c in data:
+            efs = c.get('emotions_for_sentence', [])
+            self._log(lambda: f"    - {c.get('name')}: sentence_ids={c.get('sentence_ids')}")
+            if efs:
+                self._log(lambda: f"      → Émotions de cette phrase: {efs[:3]}...")
+        return len(data) > 0
 
+    @depends_on('test_create_memory')
     def test_get_relations_by_sentence(self):
         """Test récupération des relations par sentence_id avec émotions"""
-        memory_id = f"TEST_SENT_REL_{uuid.uuid4().hex[:8]}"
-        self.test_ids.append(memory_id)
-        
-        sentence_id = self.get_next_sentence_id()
-        emotions = self.generate_emotions(1, 0.8)  # Confiance
-
-        self.client.send_request('create_memory', {
-            'id': memory_id,
-            'sentence_id': sentence_id,
-            'emotions': emotions,
-            'dominant': 'Confiance',
-            'intensity': 0.8,
-            'valence': 0.75,
-            'weight': 0.7,
-            'context': "Le chat gris dort sur le fauteuil confortable."
-        })
-
-        response = self.client.send_request('get_relations_by_sentence', {
-            'sentence_id': sentence_id
-        })
-
-        if response and response.get('success'):
-            data = response.get('data', [])
-            print(f"  → Relations pour sentence_id={sentence_id}: {len(data)}")
-            for r in data[:3]:
-                print(f"    - '{r.get('source')}' --[{r.get('relation')}]--> '{r.get('target')}'")
-                efs = r.get('relation_emotions_for_sentence', [])
-                if efs:
-                    print(f"      → Émotions: {efs[:3]}...")
-            return True
+        sentence_id, response = self._create_and_query(
+            'TEST_SENT_REL', 1, 'Confiance', 0.8, 0.75, 0.7,
+            "Le chat gris dort sur le fauteuil confortable.", 'get_relations_by_sentence',
+            by='sentence_id'
+        )
+        if response is None:
+            return False
 
-        print(f"  → Erreur: {response}")
-        return False
+        data = response.get('data', [])
+        self._log(lambda: f"  → Relations pour sentence_id={sentence_id}: {len(data)}")
+        for r in data[:3]:
+            self._log(lambda: f"    - '{r.get('source')}' --[{r.get('relation')}]--> '{r.get('target')}'")
+            efs = r.get('relation_emotions_for_sentence', [])
+            if efs:
+                self._log(lambda: f"      → Émotions: {efs[:3]}...")
+        return True
 
+    @depends_on('test_create_memory')
     def test_emotional_states_accumulation(self):
         """Test accumulation des emotional_states sur un même concept"""
         # Créer plusieurs mémoires mentionnant "parc" avec différentes émotions
@@ -910,25 +1148,24 @@ class Neo4jFullTest:
             "Le parc est magnifique au printemps."
         ]
 
+        items = []
         for i, (emotions, context) in enumerate(zip(emotions_list, contexts)):
-            mem_id = f"TEST_ACCUM_{i}_{uuid.uuid4().hex[:8]}"
-            self.test_ids.append(mem_id)
-            sentence_id = self.get_next_sentence_id()
-            sentence_ids.append(sentence_id)
-
-            self.client.send_request('create_memory', {
-                'id': mem_id,
-                'sentence_id': sentence_id,
-                'emotions': emotions,
-                'dominant': ['Joie', 'Peur', 'Sérénité'][i],
-                'intensity': 0.7 + i * 0.1,
-                'valence': [0.9, 0.2, 0.95][i],
-                'weight': 0.6,
-                'context': context
-            })
-
-        # Vérifier que le concept 'parc' a accumulé les emotional_states
-        response = self.client.send_request('get_concept', {'name': 'parc'})
+            memory = self.new_memory(
+                f"TEST_ACCUM_{i}", emotions, ['Joie', 'Peur', 'Sérénité'][i],
+                intensity=0.7 + i * 0.1, valence=[0.9, 0.2, 0.95][i], weight=0.6,
+                context=context)
+            sentence_ids.append(memory['sentence_id'])
+            items.append(memory)
+
+        # Création groupée et lecture du concept 'parc' dans le même lot : la
+        # lecture est traitée après la création et vérifie l'accumulation
+        created, response = self.client.send_requests_batch([
+            ('batch_create_memory', {'items': items}),
+            ('get_concept', {'name': 'parc'}),
+        ])
+        if not (created and created.get('success')):
+            self._write(f"  → Erreur création: {created}")
+            return False
 
         if response and response.get('success'):
             data = response.get('data', {})
@@ -937,35 +1174,37 @@ class Neo4jFullTest:
                 es = data.get('emotional_states', {})
                 analysis = data.get('emotional_analysis', {})
                 
-                print(f"  → Concept 'parc':")
-                print(f"    - Sentence IDs attendus: {sentence_ids}")
-                print(f"    - Sentence IDs trouvés: {concept_sent_ids}")
-                print(f"    - Memory IDs: {data.get('memory_ids')}")
-                print(f"    - Nombre d'états émotionnels: {len(es)}")
+                self._log(lambda: f"  → Concept 'parc':")
+                self._log(lambda: f"    - Sentence IDs attendus: {sentence_ids}")
+                self._log(lambda: f"    - Sentence IDs trouvés: {concept_sent_ids}")
+                self._log(lambda: f"    - Memory IDs: {data.get('memory_ids')}")
+                self._log(lambda: f"    - Nombre d'états émotionnels: {len(es)}")
                 
                 if analysis:
-                    print(f"    - Analyse émotionnelle:")
-                    print(f"        → Dominant global: {analysis.get('dominant_emotion')}")
-                    print(f"        → Stabilité: {analysis.get('stability', 0):.2f}")
-                    print(f"        → Trajectoire: {analysis.get('trajectory')}")
-                    print(f"        → Score trauma: {analysis.get('trauma_score', 0):.2f}")
+                    self._log(lambda: f"    - Analyse émotionnelle:")
+                    self._log(lambda: f"        → Dominant global: {analysis.get('dominant_emotion')}")
+                    self._log(lambda: f"        → Stabilité: {analysis.get('stability', 0):.2f}")
+                    self._log(lambda: f"        → Trajectoire: {analysis.get('trajectory')}")
+                    self._log(lambda: f"        → Score trauma: {analysis.get('trauma_score', 0):.2f}")
 
                 # Vérifier que certains sentence_ids sont présents
-                found_count = sum(1 for sid in sentence_ids if str(sid) in [str(k) for k in es.keys()])
-                print(f"    - États émotionnels trouvés: {found_count}/{len(sentence_ids)}")
+                # Clés JSON : déjà des chaînes côté service
+                found_count = len({str(sid) for sid in sentence_ids}.intersection(es))
+                self._log(lambda: f"    - États émotionnels trouvés: {found_count}/{len(sentence_ids)}")
                 
                 return found_count > 0
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TESTS SESSION
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @independent
     def test_create_session(self):
         """Test création de session"""
-        session_id = f"TEST_SESSION_{uuid.uuid4().hex[:8]}"
+        session_id = f"TEST_SESSION_{self.new_id()}"
 
         response = self.client.send_request('create_session', {
             'id': session_id,
@@ -973,75 +1212,74 @@ class Neo4jFullTest:
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Session créée: {data.get('id')}")
+            self._log(lambda: f"  → Session créée: {data.get('id')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @depends_on('test_create_session')
     def test_update_session(self):
         """Test mise à jour de session"""
-        session_id = f"TEST_SESSION_UPD_{uuid.uuid4().hex[:8]}"
-
-        # Créer
-        self.client.send_request('create_session', {
-            'id': session_id,
-        })
-
-        # Mettre à jour
-        response = self.client.send_request('update_session', {
-            'id': session_id,
-            'stability': 0.7,
-            'volatility': 0.3,
-            'trend': 'ascending'
-        })
+        session_id = f"TEST_SESSION_UPD_{self.new_id()}"
+
+        # Créer puis mettre à jour
+        _, response = self.client.send_requests_batch([
+            ('create_session', {'id': session_id}),
+            ('update_session', {
+                'id': session_id,
+                'stability': 0.7,
+                'volatility': 0.3,
+                'trend': 'ascending'
+            }),
+        ])
 
         if response and response.get('success'):
             data = response.get('data', {})
-            print(f"  → Session mise à jour: {data.get('id')}")
+            self._log(lambda: f"  → Session mise à jour: {data.get('id')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @depends_on('test_create_session')
     def test_get_session(self):
         """Test récupération de session (optionnel)"""
-        session_id = f"TEST_SESSION_GET_{uuid.uuid4().hex[:8]}"
+        session_id = f"TEST_SESSION_GET_{self.new_id()}"
 
-        # Créer
-        create_response = self.client.send_request('create_session', {
-            'id': session_id
-        })
+        # Créer puis récupérer, dans le même lot
+        create_response, response = self.client.send_requests_batch([
+            ('create_session', {'id': session_id}),
+            ('get_session', {'id': session_id}),
+        ])
 
         if not create_response or not create_response.get('success'):
-            print(f"  → Erreur création: {create_response}")
+            self._write(f"  → Erreur création: {create_response}")
             return False
 
-        print(f"  → Session créée: {session_id}")
-
-        # Récupérer
-        response = self.client.send_request('get_session', {'id': session_id})
+        self._log(lambda: f"  → Session créée: {session_id}")
 
         if response is None:
-            print(f"  → Service non disponible pour get_session (timeout)")
+            self._log(lambda: f"  → Service non disponible pour get_session (timeout)")
             return True  # Skip - non critique
             
         if not response.get('success'):
-            print(f"  → Échec: {response.get('error')}")
+            self._write(f"  → Échec: {response.get('error')}")
             return False
             
         data = response.get('data')
         if data:
-            print(f"  → Session récupérée: {data.get('id')}")
-            print(f"  → Stabilité: {data.get('stability')}")
+            self._log(lambda: f"  → Session récupérée: {data.get('id')}")
+            self._log(lambda: f"  → Stabilité: {data.get('stability')}")
         else:
-            print(f"  → Session créée mais non récupérée (OK)")
+            self._log(lambda: f"  → Session créée mais non récupérée (OK)")
         return True
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TESTS REQUÊTES GÉNÉRIQUES
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @independent
     def test_cypher_query(self):
         """Test requête Cypher"""
         response = self.client.send_request('cypher_query', {
@@ -1051,32 +1289,46 @@ class Neo4jFullTest:
         if response and response.get('success'):
             data = response.get('data', [])
             if data:
-                print(f"  → Total mémoires: {data[0].get('total')}")
+                self._log(lambda: f"  → Total mémoires: {data[0].get('total')}")
             return True
 
-        print(f"  → Erreur: {response}")
+        self._write(f"  → Erreur: {response}")
         return False
 
+    @independent
     def test_batch_queries(self):
         """Test batch de requêtes"""
+        # Les trois comptages en une seule instruction : chaque COUNT {} sur
+        # un label est lu dans le count store (pas de parcours des nœuds).
+        # La seconde requête, paramétrée, vérifie que le batch exécute chaque
+        # instruction et renvoie les résultats dans l'ordre des requêtes.
+        marker = f"BATCH_{self.new_id()}"
         response = self.client.send_request('batch_query', {
             'queries': [
-                {'query': "MATCH (m:Memory) RETURN count(m) AS total"},
-                {'query': "MATCH (c:Concept) RETURN count(c) AS total"},
-                {'query': "MATCH (s:Session) RETURN count(s) AS total"}
+                {'query': "RETURN COUNT { (:Memory) } AS memories, "
+                          "COUNT { (:Concept) } AS concepts, "
+                          "COUNT { (:Session) } AS sessions"},
+                {'query': "RETURN $marker AS marker", 'params': {'marker': marker}}
             ]
         })
 
         if response and response.get('success'):
             data = response.get('data', [])
-            print(f"  → Résultats batch:")
-            labels = ['Mémoires', 'Concepts', 'Sessions']
-            for i, r in enumerate(data):
-                if r:
-                    print(f"    - {labels[i]}: {r[0].get('total', 0)}")
-            return True
+            if len(data) != 2 or not data[0] or not data[1]:
+                self._write(f"  → Attendu 2 résultats non vides, reçu: {data}")
+                return False
 
-        print(f"  → Erreur: {response}")
+            totals, echo = data[0][0], data[1][0]
+            self._log(lambda: f"  → Résultats batch:")
+            for label, key in (('Mémoires', 'memories'), ('Concepts', 'concepts'), ('Sessions', 'sessions')):
+                self._log(lambda: f"    - {label}: {totals.get(key)}")
+            self._log(lambda: f"    - Marqueur: {echo.get('marker')}")
+
+            counts_ok = all(isinstance(totals.get(key), int)
+                            for key in ('memories', 'concepts', 'sessions'))
+            return counts_ok and echo.get('marker') == marker
+
+        self._write(f"  → Erreur: {response}")
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -1087,78 +1339,80 @@ class Neo4jFullTest:
         """Exécute tous les tests"""
         self.setup()
 
-        # Tests de base mémoire
-        self.run_test("Création de mémoire", self.test_create_memory)
-        self.run_test("Création mémoire avec emotional_states", self.test_create_memory_with_emotional_states)
-        self.run_test("Création mémoire avec relations", self.test_create_memory_with_relations)
-        self.run_test("Récupération de mémoire", self.test_get_memory)
-        self.run_test("Fusion de mémoires avec emotional_states", self.test_merge_memory)
-        self.run_test("Recherche mémoires similaires", self.test_find_similar)
-        self.run_test("Réactivation de mémoire", self.test_reactivate_memory)
+        tests = [(label, getattr(self, name)) for label, name in self.TESTS]
 
-        # Trauma
-        self.run_test("Création de trauma avec emotional_states", self.test_create_trauma)
+        if self.config.workers > 1:
+            self.run_parallel([t for t in tests if getattr(t[1], 'independent', False)])
+            tests = [t for t in tests if not getattr(t[1], 'independent', False)]
 
-        # Maintenance
-        self.run_test("Application du decay (oubli)", self.test_apply_decay)
+        for name, test_func in tests:
+            self.run_test(name, test_func)
 
-        # Module Dreams
-        self.run_test("Stats MCT", self.test_mct_stats)
-        self.run_test("Stats MLT", self.test_mlt_stats)
-        self.run_test("Consolidation MCT → MLT", self.test_consolidation)
-        self.run_test("Nettoyage MCT", self.test_cleanup_mct)
-        self.run_test("Cycle de rêve complet", self.test_dream_cycle)
+        self.teardown()
+        self.print_summary()
 
-        # Relations sémantiques
-        self.run_test("Extraction de relations", self.test_extract_relations)
-        self.run_test("Extraction relations avec émotions", self.test_extract_relations_with_emotions)
-
-        # Concepts avec emotional_states
-        self.run_test("Création de concept", self.test_create_concept)
-        self.run_test("Liaison mémoire-concept", self.test_link_memory_concept)
-        self.run_test("Concept avec analyse émotionnelle", self.test_get_concept_with_emotional_analysis)
-        self.run_test("Concepts par mémoire", self.test_get_concepts_by_memory)
-        self.run_test("Relations avec emotional_states", self.test_get_relations_with_emotional_states)
-        self.run_test("Concepts par sentence_id", self.test_get_concepts_by_sentence)
-        self.run_test("Relations par sentence_id", self.test_get_relations_by_sentence)
-        self.run_test("Accumulation emotional_states", self.test_emotional_states_accumulation)
+    def run_suites(self):
+        """Exécute chaque suite dans un processus dédié, puis nettoie"""
+        self.setup()
 
-        # Sessions
-        self.run_test("Création de session", self.test_create_session)
-        self.run_test("Mise à jour de session", self.test_update_session)
-        self.run_test("Récupération de session", self.test_get_session)
+        # La connexion du parent n'est pas servie pendant pool.map : fermée
+        # pour ne pas être coupée par le broker (heartbeat), rouverte ensuite
+        self.client.close()
 
-        # Requêtes génériques
-        self.run_test("Requête Cypher", self.test_cypher_query)
-        self.run_test("Batch de requêtes", self.test_batch_queries)
+        jobs = [(self.config, index, suite) for index, suite in enumerate(self.SUITES)]
+        with multiprocessing.Pool(len(jobs)) as pool:
+            for results in pool.map(_run_suite, jobs):
+                self.results.extend(results)
 
+        self.client.connect()
         self.teardown()
         self.print_summary()
 
     def print_summary(self):
-        """Affiche le résumé des tests"""
-        print("\n" + "=" * 70)
-        print("RÉSUMÉ DES TESTS")
-        print("=" * 70)
-
-        passed = sum(1 for _, success in self.results if success)
-        total = len(self.results)
+        """Affiche le résumé des tests (une seule écriture)"""
+        statuses = {True: "✓ PASS", False: "✗ FAIL", None: "⊘ SKIP"}
+        counts = dict.fromkeys(statuses, 0)
 
+        # Un seul parcours des résultats : comptage et mise en forme
+        lines = ["\n" + "=" * 70, "RÉSUMÉ DES TESTS", "=" * 70]
         for name, success in self.results:
-            status = "✓ PASS" if success else "✗ FAIL"
-            print(f"  {status}: {name}")
-
-        print("-" * 70)
-        print(f"TOTAL: {passed}/{total} tests réussis")
+            counts[success] += 1
+            lines.append(f"  {statuses[success]}: {name}")
+        passed, skipped = counts[True], counts[None]
+        total = len(self.results)
+        lines.append("-" * 70)
+        lines.append(f"TOTAL: {passed}/{total} tests réussis"
+                     + (f", {skipped} sauté(s)" if skipped else ""))
 
+        lines.append("\n" + "=" * 70)
         if passed == total:
-            print("\n" + "=" * 70)
-            print("    TOUS LES TESTS SONT PASSÉS ✓")
-            print("=" * 70)
+            lines.append("    TOUS LES TESTS SONT PASSÉS ✓")
         else:
-            print("\n" + "=" * 70)
-            print(f"    {total - passed} TEST(S) ÉCHOUÉ(S) ✗")
-            print("=" * 70)
+            failed = total - passed - skipped
+            lines.append(f"    {failed} TEST(S) ÉCHOUÉ(S), {skipped} SAUTÉ(S) ✗")
+        lines.append("=" * 70)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _run_suite(job) -> List[Tuple[str, Optional[bool]]]:
+    """Exécute une suite dans un processus worker avec sa propre connexion
+
+    Le nettoyage par préfixe (sessions, concepts) est laissé au processus
+    parent : il supprimerait les données des suites encore en cours.
+    """
+    config, index, suite = job
+    # Plages de sentence_ids disjointes entre processus
+    test_suite = Neo4jFullTest(config, first_sentence_id=(index + 1) * 100000 + 1)
+    test_suite.client.connect()
+    try:
+        for label, name in Neo4jFullTest.SUITES[suite]:
+            test_suite.run_test(label, getattr(test_suite, name))
+        test_suite.cleanup_ids()
+    finally:
+        test_suite.client.close()
+    return test_suite.results
 
 
 def main():
@@ -1178,7 +1432,10 @@ def main():
     config = TestConfig(
         rabbitmq_host=rabbitmq_host,
         rabbitmq_user=rabbitmq_user,
-        rabbitmq_pass=rabbitmq_pass
+        rabbitmq_pass=rabbitmq_pass,
+        workers=8 if '--parallel' in sys.argv else 1,
+        compression=os.environ.get('TEST_COMPRESSION') or None,
+        use_msgpack=os.environ.get('TEST_MSGPACK', '0') == '1'
     )
 
     print(f"RabbitMQ: {config.rabbitmq_host}")
@@ -1186,7 +1443,10 @@ def main():
 
     # Exécuter les tests
     test_suite = Neo4jFullTest(config)
-    test_suite.run_all_tests()
+    if '--suites' in sys.argv:
+        test_suite.run_suites()
+    else:
+        test_suite.run_all_tests()
 
 
 if __name__ == "__main__":